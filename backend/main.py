@@ -4,7 +4,8 @@ import logging
 
 from parsers import extract_financials_from_pdf, extract_financials_from_csv, extract_financials_from_excel
 from models import CompanyFinancials, AcquisitionRequest, AcquisitionResponse, MemoRequest, MemoResponse
-from services import AcquisitionAnalyzer, MemoGenerator
+from models import DealTermsPatch, DealSessionResponse, DealSessionDiff
+from services import AcquisitionAnalyzer, MemoGenerator, DealSessionManager
 
 app = FastAPI(title="AI Banker Copilot", version="1.0.0")
 
@@ -15,6 +16,7 @@ logger = logging.getLogger(__name__)
 # Initialize services
 acquisition_analyzer = AcquisitionAnalyzer()
 memo_generator = MemoGenerator()
+deal_sessions = DealSessionManager(acquisition_analyzer)
 
 @app.post("/upload_financials")
 async def upload_financials(
@@ -79,6 +81,57 @@ async def model_acquisition(request: AcquisitionRequest):
         logger.error(f"Acquisition modeling error: {str(e)}")
         raise HTTPException(status_code=422, detail=f"Acquisition modeling failed: {str(e)}")
 
+@app.post("/deal_sessions", response_model=DealSessionResponse)
+async def create_deal_session(request: AcquisitionRequest):
+    """
+    Open a deal session for interactive what-if modeling.
+    
+    Parses acquirer and target financials once and keeps them on the server,
+    returning the session id along with the initial pro-forma and key metrics.
+    """
+    try:
+        return deal_sessions.create_session(request)
+        
+    except Exception as e:
+        logger.error(f"Deal session creation error: {str(e)}")
+        raise HTTPException(status_code=422, detail=f"Deal session creation failed: {str(e)}")
+
+@app.get("/deal_sessions/{session_id}", response_model=DealSessionResponse)
+async def get_deal_session(session_id: str):
+    """Return the current deal terms and outputs of a deal session."""
+    try:
+        return deal_sessions.get_session(session_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Deal session not found: {session_id}")
+
+@app.patch("/deal_sessions/{session_id}", response_model=DealSessionDiff)
+async def update_deal_session(session_id: str, patch: DealTermsPatch):
+    """
+    Change one or more deal terms within a session.
+    
+    Only outputs that depend on the changed terms are recomputed; the response
+    lists the recomputed nodes and the old/new value of every output that moved.
+    """
+    try:
+        result = deal_sessions.update_session(session_id, patch)
+        logger.info(f"Updated deal session {session_id}: {', '.join(result.changed_inputs) or 'no changes'}")
+        return result
+        
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Deal session not found: {session_id}")
+    except Exception as e:
+        logger.error(f"Deal session update error: {str(e)}")
+        raise HTTPException(status_code=422, detail=f"Deal session update failed: {str(e)}")
+
+@app.delete("/deal_sessions/{session_id}")
+async def delete_deal_session(session_id: str):
+    """Close a deal session and release its state."""
+    try:
+        deal_sessions.delete_session(session_id)
+        return {"message": f"Deal session {session_id} closed"}
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Deal session not found: {session_id}")
+
 @app.post("/generate_memo", response_model=MemoResponse)
 async def generate_memo(request: MemoRequest):
     """
@@ -5,7 +5,12 @@ from .deal_models import (
     DealTerms, 
     AcquisitionRequest, 
     KeyMetrics, 
-    AcquisitionResponse
+    AcquisitionResponse,
+    FinancingMixPatch,
+    SynergiesPatch,
+    DealTermsPatch,
+    DealSessionResponse,
+    DealSessionDiff
 )
 from .memo_models import DealSummary, MemoRequest, MemoResponse, MemoFormat
 
@@ -18,6 +23,11 @@ __all__ = [
     "AcquisitionRequest",
     "KeyMetrics",
     "AcquisitionResponse",
+    "FinancingMixPatch",
+    "SynergiesPatch",
+    "DealTermsPatch",
+    "DealSessionResponse",
+    "DealSessionDiff",
     "DealSummary",
     "MemoRequest", 
     "MemoResponse",
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
 class FinancingMix(BaseModel):
@@ -30,3 +30,30 @@ class KeyMetrics(BaseModel):
 class AcquisitionResponse(BaseModel):
     pro_forma_financials: Dict[str, Any]
     key_metrics: KeyMetrics
+
+class FinancingMixPatch(BaseModel):
+    equity_percent: Optional[float] = None
+    debt_percent: Optional[float] = None
+
+class SynergiesPatch(BaseModel):
+    annual_savings: Optional[float] = None
+    duration_years: Optional[int] = None
+
+class DealTermsPatch(BaseModel):
+    deal_value: Optional[float] = None
+    financing_mix: Optional[FinancingMixPatch] = None
+    synergies: Optional[SynergiesPatch] = None
+    premium: Optional[float] = None
+
+class DealSessionResponse(BaseModel):
+    session_id: str
+    deal_terms: DealTerms
+    pro_forma_financials: Dict[str, Any]
+    key_metrics: KeyMetrics
+
+class DealSessionDiff(BaseModel):
+    session_id: str
+    deal_terms: DealTerms
+    changed_inputs: List[str]
+    recomputed: List[str]
+    changes: Dict[str, Dict[str, Any]]
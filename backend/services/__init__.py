@@ -1,4 +1,5 @@
 from .acquisition_analyzer import AcquisitionAnalyzer
 from .memo_generator import MemoGenerator
+from .deal_session import DealSession, DealSessionManager
 
-__all__ = ["AcquisitionAnalyzer", "MemoGenerator"]
+__all__ = ["AcquisitionAnalyzer", "MemoGenerator", "DealSession", "DealSessionManager"]
@@ -1,10 +1,20 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from models.deal_models import AcquisitionRequest, AcquisitionResponse, KeyMetrics
 
 logger = logging.getLogger(__name__)
 
 class AcquisitionAnalyzer:
+    # Dependency graph over the deal model, listed in topological order.
+    # Each node names the deal-term inputs (dotted paths) and upstream nodes its
+    # method below reads; keep these in sync when a calculation starts using a new term.
+    NODE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+        "debt_financing": ("deal_value", "financing_mix.debt_percent"),
+        "equity_financing": ("deal_value", "financing_mix.equity_percent"),
+        "pro_forma_financials": ("synergies.annual_savings", "debt_financing"),
+        "key_metrics": ("deal_value", "synergies.annual_savings", "debt_financing", "equity_financing"),
+    }
+
     def __init__(self):
         self.logger = logger
 
@@ -12,40 +22,45 @@ class AcquisitionAnalyzer:
         """Analyze acquisition and generate pro-forma financials"""
         try:
             # Extract latest year data for both companies
-            acquirer_latest = self._get_latest_year_data(request.acquirer_data)
-            target_latest = self._get_latest_year_data(request.target_data)
-            
-            # Calculate financing breakdown
-            debt_financing = request.deal_terms.deal_value * (request.deal_terms.financing_mix.debt_percent / 100)
-            equity_financing = request.deal_terms.deal_value * (request.deal_terms.financing_mix.equity_percent / 100)
+            acquirer_latest = self.get_latest_year_data(request.acquirer_data)
+            target_latest = self.get_latest_year_data(request.target_data)
             
-            # Generate pro-forma financials
-            pro_forma = self._generate_pro_forma(
-                acquirer_latest, 
-                target_latest, 
-                request.deal_terms,
-                debt_financing
-            )
-            
-            # Calculate key metrics
-            key_metrics = self._calculate_key_metrics(
-                acquirer_latest,
-                target_latest,
-                request.deal_terms,
-                debt_financing,
-                equity_financing
-            )
+            # Compute every node of the deal model in dependency order
+            values: Dict[str, Any] = {}
+            for node in self.NODE_DEPENDENCIES:
+                values[node] = self.compute_node(
+                    node, acquirer_latest, target_latest, request.deal_terms, values
+                )
             
             return AcquisitionResponse(
-                pro_forma_financials=pro_forma,
-                key_metrics=key_metrics
+                pro_forma_financials=values["pro_forma_financials"],
+                key_metrics=values["key_metrics"]
             )
             
         except Exception as e:
             self.logger.error(f"Acquisition analysis error: {str(e)}")
             raise
 
-    def _get_latest_year_data(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
+    def compute_node(self, node: str, acquirer: Dict[str, Any], target: Dict[str, Any],
+                     deal_terms, values: Dict[str, Any]) -> Any:
+        """Compute a single node of the deal model from its upstream node values"""
+        if node == "debt_financing":
+            return self.calculate_debt_financing(deal_terms)
+        if node == "equity_financing":
+            return self.calculate_equity_financing(deal_terms)
+        if node == "pro_forma_financials":
+            return self.generate_pro_forma(acquirer, target, deal_terms, values["debt_financing"])
+        if node == "key_metrics":
+            return self.calculate_key_metrics(
+                acquirer,
+                target,
+                deal_terms,
+                values["debt_financing"],
+                values["equity_financing"]
+            )
+        raise KeyError(f"Unknown deal model node: {node}")
+
+    def get_latest_year_data(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract the most recent year's financial data"""
         income_statement = company_data.get("income_statement", {})
         if not income_statement:
@@ -55,8 +70,16 @@ class AcquisitionAnalyzer:
         latest_year = max(income_statement.keys()) if income_statement else "2023"
         return income_statement.get(latest_year, {})
 
-    def _generate_pro_forma(self, acquirer: Dict[str, Any], target: Dict[str, Any], 
-                           deal_terms, debt_financing: float) -> Dict[str, Any]:
+    def calculate_debt_financing(self, deal_terms) -> float:
+        """Portion of the deal value funded with new debt"""
+        return deal_terms.deal_value * (deal_terms.financing_mix.debt_percent / 100)
+
+    def calculate_equity_financing(self, deal_terms) -> float:
+        """Portion of the deal value funded with newly issued equity"""
+        return deal_terms.deal_value * (deal_terms.financing_mix.equity_percent / 100)
+
+    def generate_pro_forma(self, acquirer: Dict[str, Any], target: Dict[str, Any], 
+                          deal_terms, debt_financing: float) -> Dict[str, Any]:
         """Generate combined pro-forma financial statements"""
         
         # Combined revenue
@@ -90,8 +113,8 @@ class AcquisitionAnalyzer:
             }
         }
 
-    def _calculate_key_metrics(self, acquirer: Dict[str, Any], target: Dict[str, Any],
-                              deal_terms, debt_financing: float, equity_financing: float) -> KeyMetrics:
+    def calculate_key_metrics(self, acquirer: Dict[str, Any], target: Dict[str, Any],
+                             deal_terms, debt_financing: float, equity_financing: float) -> KeyMetrics:
         """Calculate key deal metrics"""
         
         # Estimate shares outstanding (simplified - assume $50 per share)
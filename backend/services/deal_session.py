@@ -0,0 +1,174 @@
+import logging
+import time
+import uuid
+from typing import Dict, Any, List, Tuple
+from models.deal_models import (
+    AcquisitionRequest,
+    DealTerms,
+    DealTermsPatch,
+    DealSessionResponse,
+    DealSessionDiff
+)
+from services.acquisition_analyzer import AcquisitionAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+def _flatten(data: Any, prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dicts into a mapping of dotted paths to leaf values"""
+    if not isinstance(data, dict):
+        return {prefix: data}
+
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        flat.update(_flatten(value, path))
+    return flat
+
+
+def _merge(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively apply non-null patch values on top of base"""
+    merged = dict(base)
+    for key, value in patch.items():
+        if value is None:
+            continue
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class DealSession:
+    """Server-side deal state that recomputes only outputs affected by a term change"""
+
+    def __init__(self, session_id: str, request: AcquisitionRequest, analyzer: AcquisitionAnalyzer):
+        self.session_id = session_id
+        self.analyzer = analyzer
+        self.last_accessed = time.monotonic()
+        # Company data is parsed once and reused for every what-if
+        self.acquirer_latest = analyzer.get_latest_year_data(request.acquirer_data)
+        self.target_latest = analyzer.get_latest_year_data(request.target_data)
+        values, _ = self._recompute(request.deal_terms, {}, set(_flatten(request.deal_terms.dict())))
+        self.deal_terms = request.deal_terms
+        self._values: Dict[str, Any] = values
+
+    def _recompute(self, deal_terms: DealTerms, values: Dict[str, Any],
+                   dirty: set) -> Tuple[Dict[str, Any], List[str]]:
+        """Recompute nodes downstream of the dirty inputs into a copy of values, stopping where values are unchanged"""
+        values = dict(values)
+        dirty = set(dirty)
+        recomputed = []
+        for node, dependencies in self.analyzer.NODE_DEPENDENCIES.items():
+            if node in values and dirty.isdisjoint(dependencies):
+                continue
+            value = self.analyzer.compute_node(node, self.acquirer_latest, self.target_latest, deal_terms, values)
+            recomputed.append(node)
+            if node not in values or values[node] != value:
+                values[node] = value
+                dirty.add(node)
+        return values, recomputed
+
+    def _outputs(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "pro_forma_financials": values["pro_forma_financials"],
+            "key_metrics": values["key_metrics"].dict()
+        }
+
+    def snapshot(self) -> DealSessionResponse:
+        return DealSessionResponse(
+            session_id=self.session_id,
+            deal_terms=self.deal_terms,
+            pro_forma_financials=self._values["pro_forma_financials"],
+            key_metrics=self._values["key_metrics"]
+        )
+
+    def apply_patch(self, patch: DealTermsPatch) -> DealSessionDiff:
+        """Apply a partial deal-term change and return only the outputs that moved"""
+        old_inputs = _flatten(self.deal_terms.dict())
+        new_terms = DealTerms(**_merge(self.deal_terms.dict(), patch.dict(exclude_unset=True)))
+        new_inputs = _flatten(new_terms.dict())
+
+        changed_inputs = [path for path, value in new_inputs.items() if old_inputs.get(path) != value]
+        if not changed_inputs:
+            return DealSessionDiff(
+                session_id=self.session_id,
+                deal_terms=self.deal_terms,
+                changed_inputs=[],
+                recomputed=[],
+                changes={}
+            )
+
+        # Compute into a copy so a failing node leaves the session untouched
+        new_values, recomputed = self._recompute(new_terms, self._values, set(changed_inputs))
+        old_outputs = _flatten(self._outputs(self._values))
+        new_outputs = _flatten(self._outputs(new_values))
+        self.deal_terms = new_terms
+        self._values = new_values
+
+        changes = {
+            path: {"old": old_outputs.get(path), "new": value}
+            for path, value in new_outputs.items()
+            if old_outputs.get(path) != value
+        }
+
+        return DealSessionDiff(
+            session_id=self.session_id,
+            deal_terms=self.deal_terms,
+            changed_inputs=changed_inputs,
+            recomputed=recomputed,
+            changes=changes
+        )
+
+
+class DealSessionManager:
+    """
+    In-memory registry of active deal sessions.
+
+    Sessions not accessed for ttl_seconds are expired, and once max_sessions
+    are open the least recently accessed session is evicted to make room.
+    """
+
+    def __init__(self, analyzer: AcquisitionAnalyzer, ttl_seconds: float = 3600, max_sessions: int = 100):
+        self.logger = logger
+        self.analyzer = analyzer
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, DealSession] = {}
+
+    def create_session(self, request: AcquisitionRequest) -> DealSessionResponse:
+        session_id = uuid.uuid4().hex
+        session = DealSession(session_id, request, self.analyzer)
+        self._evict_expired()
+        while len(self._sessions) >= self.max_sessions:
+            oldest_id = min(self._sessions, key=lambda sid: self._sessions[sid].last_accessed)
+            del self._sessions[oldest_id]
+            self.logger.info(f"Evicted deal session {oldest_id} (session limit reached)")
+        self._sessions[session_id] = session
+        self.logger.info(f"Created deal session {session_id}")
+        return session.snapshot()
+
+    def get_session(self, session_id: str) -> DealSessionResponse:
+        return self._get(session_id).snapshot()
+
+    def update_session(self, session_id: str, patch: DealTermsPatch) -> DealSessionDiff:
+        return self._get(session_id).apply_patch(patch)
+
+    def delete_session(self, session_id: str) -> None:
+        self._get(session_id)
+        del self._sessions[session_id]
+
+    def _get(self, session_id: str) -> DealSession:
+        self._evict_expired()
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise KeyError(f"Deal session not found: {session_id}")
+        session.last_accessed = time.monotonic()
+        return session
+
+    def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [sid for sid, session in self._sessions.items() if session.last_accessed < cutoff]
+        for session_id in expired:
+            del self._sessions[session_id]
+            self.logger.info(f"Expired deal session {session_id}")